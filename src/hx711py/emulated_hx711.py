@@ -13,12 +13,17 @@ class HX711:
         self.dout = dout
 
         # Last time we've been read.
-        self.last_read_time = time.time()
+        self.last_read_time = time.monotonic()
         self.sample_rate_hz = 80.0
-        self.reset_timestamp = time.time()
+        self.reset_timestamp = time.monotonic()
         self.sample_count = 0
         self.simulate_tare = False
 
+        # When set, samples are produced immediately and the virtual clock is
+        # advanced by one sample period per read, instead of waiting in real
+        # time.  Handy for tests that don't care about timing.
+        self.fast_emulation = False
+
         # Mutex for reading from the HX711, in case multiple threads in client
         # software try to access get values from the class at the same time.
         self.read_lock = threading.Lock()
@@ -33,41 +38,33 @@ class HX711:
 
         self.debug_printing = False
 
-        self.byte_format = 'MSB'
-        self.bit_format = 'MSB'
+        self.set_reading_format('MSB', 'MSB')
 
         self.set_gain(gain)
 
-        # Think about whether this is necessary.
-        time.sleep(1)
-
     def convert_to_twos_complement_24_bit(self, input_value):
-        # HX711 has saturating logic.
-        if input_value >= 0x7fffff:
-            return 0x7fffff
-
-        # If it's a positive value, just return it, masked with our max value.
-        if input_value >= 0:
-            return input_value & 0x7fffff
+        # HX711 has saturating logic, so clamp to the 24bit signed range and
+        # then mask to get the two's complement bit pattern.
+        return max(-0x800000, min(0x7fffff, int(input_value))) & 0xffffff
 
-        if input_value < 0:
-            # HX711 has saturating logic.
-            if input_value < -0x800000:
-                input_value = -0x800000
+    def convert_from_twos_complement_24_bit(self, input_value):
+        # Flip the sign bit and subtract its weight to sign-extend in one step.
+        return (input_value ^ 0x800000) - 0x800000
 
-            diff = input_value + 0x800000
+    @property
+    def sample_rate_hz(self):
+        return self._sample_rate_hz
 
-            return 0x800000 + diff
+    @sample_rate_hz.setter
+    def sample_rate_hz(self, sample_rate_hz):
+        self._sample_rate_hz = sample_rate_hz
 
-    def convert_from_twos_complement_24_bit(self, input_value):
-        return -(input_value & 0x800000) + (input_value & 0x7fffff)
-
-    def is_ready(self):
         # Calculate how long we should be waiting between samples, given the
-        # sample rate.
-        sample_delay_seconds = 1.0 / self.sample_rate_hz
+        # sample rate, once here rather than on every readiness check.
+        self._sample_delay_seconds = 1.0 / sample_rate_hz
 
-        return time.time() >= self.last_read_time + sample_delay_seconds
+    def is_ready(self):
+        return time.monotonic() >= self.last_read_time + self._sample_delay_seconds
 
     def set_gain(self, gain):
         if gain == 128:
@@ -96,26 +93,37 @@ class HX711:
         # driving the virtual HX711 serial interface.
         with self.read_lock:
 
-            # Wait until HX711 is ready for us to read a sample.
-            while not self.is_ready():
-                pass
-
-            self.last_read_time = time.time()
-
-            # Generate a 24bit 2s complement sample for the virtual HX711.
-            raw_sample = self.convert_to_twos_complement_24_bit(
-                self.generate_fake_sample())
-
-            # Read three bytes of data from the HX711.
-            first_byte = (raw_sample >> 16) & 0xFF
-            second_byte = (raw_sample >> 8) & 0xFF
-            third_byte = raw_sample & 0xFF
-
-        # Depending on how we're configured, return an orderd list of raw byte
-        # values.
-        if self.byte_format == 'LSB':
-            return [third_byte, second_byte, first_byte]
-        return [first_byte, second_byte, third_byte]
+            # Sleep until the virtual HX711 is due to have a sample ready for
+            # us.  If we're already late, the sample is ready right now.
+            due = self.last_read_time + self._sample_delay_seconds
+            if not self.fast_emulation:
+                now = time.monotonic()
+                latest = now + self._sample_delay_seconds
+                if due > latest:
+                    # The virtual clock ran ahead while emulating fast.  Pull it
+                    # back to the wall clock, and the reset time with it, so
+                    # the fake signal carries on instead of jumping back.
+                    self.reset_timestamp -= due - latest
+                    due = latest
+                elif due < now:
+                    due = now
+                time.sleep(due - now)
+
+            self.last_read_time = due
+
+            sample = self.generate_fake_sample()
+
+        # Generate a 24bit 2s complement sample for the virtual HX711.
+        raw_sample = self.convert_to_twos_complement_24_bit(sample)
+
+        # Read three bytes of data from the HX711.
+        first_byte = (raw_sample >> 16) & 0xFF
+        second_byte = (raw_sample >> 8) & 0xFF
+        third_byte = raw_sample & 0xFF
+
+        # Depending on how we're configured, return the raw byte values in
+        # order.
+        return bytes((first_byte, second_byte, third_byte))[::self._byte_step]
 
     def read_long(self):
         # Get a sample from the HX711 in the form of raw bytes.
@@ -124,10 +132,9 @@ class HX711:
         if self.debug_printing:
             print(data_bytes,)
 
-        # Join the raw bytes into a single 24bit 2s complement value.
-        twos_complement_value = ((data_bytes[0] << 16) |
-                               (data_bytes[1] << 8) |
-                               data_bytes[2])
+        # Join the raw bytes into a single 24bit 2s complement value.  They
+        # have already been put in order by read_raw_bytes().
+        twos_complement_value = int.from_bytes(data_bytes, 'big')
 
         if self.debug_printing:
             print("Twos: 0x%06x" % twos_complement_value)
@@ -155,24 +162,17 @@ class HX711:
         # If we're averaging across a low amount of values, just take an
         # arithmetic mean.
         if times < 5:
-            values = int(0)
-            for _ in range(times):
-                values += self.read_long()
-
-            return values / times
+            return sum(self.read_long() for _ in range(times)) / times
 
         # If we're taking a lot of samples, we'll collect them in a list, remove
         # the outliers, then take the mean of the remaining set.
-        value_list = []
+        value_list = [self.read_long() for _ in range(times)]
 
-        for _ in range(times):
-            value_list += [self.read_long()]
+        # We'll be trimming 20% of outlier samples from top and bottom of collected set.
+        trim_amount = int(times * 0.2)
 
         value_list.sort()
 
-        # We'll be trimming 20% of outlier samples from top and bottom of collected set.
-        trim_amount = int(len(value_list) * 0.2)
-
         # Trim the edge case values.
         value_list = value_list[trim_amount:-trim_amount]
 
@@ -224,6 +224,9 @@ class HX711:
         else:
             print(f"Unrecognised bit_format: \"{bit_format}\"")
 
+        # Resolve the byte order once here so reads don't compare strings.
+        self._byte_step = -1 if self.byte_format == 'LSB' else 1
+
     def set_offset(self, offset):
         self.offset = offset
 
@@ -266,14 +269,20 @@ class HX711:
         # self.power_up()
 
         # Mark time when we were reset.  We'll use this for sample generation.
-        self.reset_timestamp = time.time()
+        # When emulating fast, samples follow the virtual clock, so measure
+        # from that instead of the wall clock.
+        if self.fast_emulation:
+            self.reset_timestamp = self.last_read_time
+        else:
+            self.reset_timestamp = time.monotonic()
 
     def generate_fake_sample(self):
-        sample_timestamp = time.time() - self.reset_timestamp
+        # Samples are taken at the time read_raw_bytes() says they're due,
+        # which follows the virtual clock when emulating fast.
+        sample_timestamp = self.last_read_time - self.reset_timestamp
 
         noise_scale = 1.0
-        noise_value = random.randrange(-(noise_scale * 1000),
-                                      (noise_scale * 1000)) / 1000.0
+        noise_value = random.uniform(-noise_scale, noise_scale)
         sample = math.sin(math.radians(sample_timestamp * 20)) * 72.0
 
         self.sample_count += 1
@@ -287,7 +296,7 @@ class HX711:
         big_error_samples = [0.0, 40.0, 70.0, 150.0, 280.0, 580.0]
 
         if random.randrange(0, big_error_sample_frequency) == 0:
-            sample = random.sample(big_error_samples, 1)[0]
+            sample = random.choice(big_error_samples)
             print(f"Sample {self.sample_count}: Injecting {sample} as a random bad sample.")
 
         sample *= 1000
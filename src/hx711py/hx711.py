@@ -8,7 +8,7 @@ import RPi.GPIO as GPIO
 class HX711:
     """Class to interact with an HX711 ADC"""
 
-    def __init__(self, dout, pd_sck, gain=128):
+    def __init__(self, dout, pd_sck, gain=128, settle=True):
         self.pd_sck = pd_sck
 
         self.dout = dout
@@ -21,6 +21,16 @@ class HX711:
         GPIO.setup(self.pd_sck, GPIO.OUT)
         GPIO.setup(self.dout, GPIO.IN)
 
+        # Keep the GPIO functions used per bit on the instance, sparing a
+        # module attribute lookup on every call.
+        self._gpio_output = GPIO.output
+        self._gpio_input = GPIO.input
+
+        # Whether GPIO.wait_for_edge() can be used to wait for samples.  It
+        # isn't available on every kernel, or once the client has set up its
+        # own event detection on DOUT.
+        self._edge_wait_available = True
+
         self.gain = 0
 
         # The value returned by the hx711 that corresponds to your reference
@@ -34,29 +44,35 @@ class HX711:
 
         self.debug_printing = False
 
-        self.byte_format = 'MSB'
-        self.bit_format = 'MSB'
+        self.set_reading_format('MSB', 'MSB')
 
         self.set_gain(gain)
 
-        # Think about whether this is necessary.
-        time.sleep(1)
+        # Give the HX711 time to settle after power up (400 ms worst case per
+        # the datasheet).  Callers that know the chip is already running can
+        # skip this with settle=False.
+        if settle:
+            time.sleep(0.4)
 
     def convert_from_twos_complement_24_bit(self, input_value):
-        return -(input_value & 0x800000) + (input_value & 0x7fffff)
+        # Flip the sign bit and subtract its weight to sign-extend in one step.
+        return (input_value ^ 0x800000) - 0x800000
 
     def is_ready(self):
-        return GPIO.input(self.dout) == 0
+        return self._gpio_input(self.dout) == 0
 
     def set_gain(self, gain):
-        if gain == 128:
-            self.gain = 1
-        elif gain == 64:
-            self.gain = 3
-        elif gain == 32:
-            self.gain = 2
+        # Wait for and get the Read Lock, so the gain can't change and PD_SCK
+        # can't be driven while another thread is mid-read.
+        with self.read_lock:
+            if gain == 128:
+                self.gain = 1
+            elif gain == 64:
+                self.gain = 3
+            elif gain == 32:
+                self.gain = 2
 
-        GPIO.output(self.pd_sck, False)
+            GPIO.output(self.pd_sck, False)
 
         # Read out a set of raw bytes and throw it away.
         self.read_raw_bytes()
@@ -76,25 +92,46 @@ class HX711:
         # Clock HX711 Digital Serial Clock (PD_SCK).  DOUT will be
         # ready 1us after PD_SCK rising edge, so we sample after
         # lowering PD_SCL, when we know DOUT will be stable.
-        GPIO.output(self.pd_sck, True)
-        GPIO.output(self.pd_sck, False)
-        value = GPIO.input(self.dout)
+        self._gpio_output(self.pd_sck, True)
+        self._gpio_output(self.pd_sck, False)
+        value = self._gpio_input(self.dout)
 
         # Convert Boolean to int and return it.
         return int(value)
 
     def read_next_byte(self):
+        # set_reading_format() points _read_next_byte at the reader for the
+        # configured bit format, so there's no format check per bit.
+        return self._read_next_byte()
+
+    # The two readers below clock the bits in themselves, as read_next_bit()
+    # does, with the GPIO functions and pins held in locals, rather than
+    # paying for a read_next_bit() call per bit.
+
+    def _read_byte_msb(self):
+        output, input_ = self._gpio_output, self._gpio_input
+        pd_sck, dout = self.pd_sck, self.dout
+        byte_value = 0
+
+        # Read bits and build the byte from the top.
+        for _ in range(8):
+            output(pd_sck, True)
+            output(pd_sck, False)
+            byte_value = (byte_value << 1) | int(input_(dout))
+
+        # Return the packed byte.
+        return byte_value
+
+    def _read_byte_lsb(self):
+        output, input_ = self._gpio_output, self._gpio_input
+        pd_sck, dout = self.pd_sck, self.dout
         byte_value = 0
 
-        # Read bits and build the byte from top, or bottom, depending
-        # on whether we are in MSB or LSB bit mode.
+        # Read bits and build the byte from the bottom.
         for _ in range(8):
-            if self.bit_format == 'MSB':
-                byte_value <<= 1
-                byte_value |= self.read_next_bit()
-            else:
-                byte_value >>= 1
-                byte_value |= self.read_next_bit() * 0x80
+            output(pd_sck, True)
+            output(pd_sck, False)
+            byte_value = (byte_value >> 1) | (int(input_(dout)) << 7)
 
         # Return the packed byte.
         return byte_value
@@ -104,26 +141,37 @@ class HX711:
         # driving the HX711 serial interface.
         with self.read_lock:
 
-            # Wait until HX711 is ready for us to read a sample.
+            # Wait until HX711 is ready for us to read a sample.  DOUT goes low
+            # when a conversion is available, so sleep on the falling edge
+            # rather than spinning.  The timeout bounds the wait should the
+            # edge fire between the ready check and the edge wait.  If edge
+            # detection isn't available, poll every millisecond instead.
             while not self.is_ready():
-                pass
+                if self._edge_wait_available:
+                    try:
+                        GPIO.wait_for_edge(self.dout, GPIO.FALLING, timeout=100)
+                        continue
+                    except RuntimeError:
+                        self._edge_wait_available = False
+
+                time.sleep(0.001)
 
             # Read three bytes of data from the HX711.
             first_byte = self.read_next_byte()
             second_byte = self.read_next_byte()
             third_byte = self.read_next_byte()
 
-            # HX711 Channel and gain factor are set by number of bits read
-            # after 24 data bits.
+            # HX711 Channel and gain factor are set by number of clock pulses
+            # after 24 data bits.  DOUT carries nothing useful during these,
+            # so just pulse PD_SCK without sampling it.
+            output, pd_sck = self._gpio_output, self.pd_sck
             for _ in range(self.gain):
-                # Clock a bit out of the HX711 and throw it away.
-                self.read_next_bit()
+                output(pd_sck, True)
+                output(pd_sck, False)
 
-        # Depending on how we're configured, return an orderd list of raw byte
-        # values.
-        if self.byte_format == 'LSB':
-            return [third_byte, second_byte, first_byte]
-        return [first_byte, second_byte, third_byte]
+        # Depending on how we're configured, return the raw byte values in
+        # order.
+        return bytes((first_byte, second_byte, third_byte))[::self._byte_step]
 
     def read_long(self):
         # Get a sample from the HX711 in the form of raw bytes.
@@ -132,10 +180,9 @@ class HX711:
         if self.debug_printing:
             print(data_bytes,)
 
-        # Join the raw bytes into a single 24bit 2s complement value.
-        twos_complement_value = ((data_bytes[0] << 16) |
-                               (data_bytes[1] << 8) |
-                               data_bytes[2])
+        # Join the raw bytes into a single 24bit 2s complement value.  They
+        # have already been put in order by read_raw_bytes().
+        twos_complement_value = int.from_bytes(data_bytes, 'big')
 
         if self.debug_printing:
             print("Twos: 0x%06x" % twos_complement_value)
@@ -166,16 +213,13 @@ class HX711:
 
         # If we're taking a lot of samples, we'll collect them in a list, remove
         # the outliers, then take the mean of the remaining set.
-        value_list = []
+        value_list = [self.read_long() for _ in range(times)]
 
-        for _ in range(times):
-            value_list += [self.read_long()]
+        # We'll be trimming 20% of outlier samples from top and bottom of collected set.
+        trim_amount = int(times * 0.2)
 
         value_list.sort()
 
-        # We'll be trimming 20% of outlier samples from top and bottom of collected set.
-        trim_amount = int(len(value_list) * 0.2)
-
         # Trim the edge case values.
         value_list = value_list[trim_amount:-trim_amount]
 
@@ -194,21 +238,19 @@ class HX711:
         if times == 1:
             return self.read_long()
 
-        value_list = []
-
-        for _ in range(times):
-            value_list.append(self.read_long())
+        value_list = [self.read_long() for _ in range(times)]
 
         value_list.sort()
 
+        midpoint = times // 2
+
         # If times is odd we can just take the centre value.
         if (times & 0x1) == 0x1:
-            return value_list[len(value_list) // 2]
+            return value_list[midpoint]
 
         # If times is even we have to take the arithmetic mean of
         # the two middle values.
-        midpoint = int(len(value_list) / 2)
-        return sum(value_list[midpoint-1:midpoint+1]) / 2.0
+        return (value_list[midpoint - 1] + value_list[midpoint]) / 2.0
 
     # Compatibility function, uses channel A version
 
@@ -299,6 +341,14 @@ class HX711:
             raise ValueError(f"Unrecognised bitformat: \"{bit_format}\"")
         self.bit_format = bit_format
 
+        # Resolve the formats once here so reads don't compare strings for
+        # every byte and bit.
+        self._byte_step = -1 if byte_format.upper() == 'LSB' else 1
+        if bit_format.upper() == 'MSB':
+            self._read_next_byte = self._read_byte_msb
+        else:
+            self._read_next_byte = self._read_byte_lsb
+
     # sets offset for channel A for compatibility reasons
     def set_offset(self, offset):
         self.set_offset_a(offset)